@@ -13,11 +13,15 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+import collections
 import logging
 import multiprocessing
+import threading
 import time
 import os
 
+from concurrent.futures import Executor
+from concurrent.futures import Future
 from concurrent.futures import ThreadPoolExecutor
 
 from sawtooth_validator.concurrent import atomic
@@ -26,9 +30,145 @@ from sawtooth_validator.concurrent import atomic
 LOGGER = logging.getLogger(__name__)
 
 
+class WorkStealingThreadPoolExecutor(Executor):
+    """A thread pool executor in which each worker has a deque of its own.
+
+    Submitted tasks are appended to the deque of the least loaded worker,
+    and only that worker is woken. A worker takes tasks from the front of
+    its own deque and, when that is empty, steals from the front of its
+    siblings' deques before going back to sleep, so that tasks queued behind
+    a blocked worker still run roughly in the order they were submitted.
+    This avoids the single queue, shared by every worker and submitter, of
+    ThreadPoolExecutor.
+    """
+
+    def __init__(self, max_workers=None, thread_name_prefix=''):
+        if max_workers is None:
+            max_workers = multiprocessing.cpu_count() * 5
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix or 'WorkStealing'
+
+        self._deques = [collections.deque() for _ in range(max_workers)]
+        self._wakeups = [threading.Event() for _ in range(max_workers)]
+        self._busy = [False] * max_workers
+        self._threads = [None] * max_workers
+        self._next_worker = 0
+
+        self._shutdown = False
+        self._submit_lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        with self._submit_lock:
+            if self._shutdown:
+                raise RuntimeError(
+                    'cannot schedule new futures after shutdown')
+
+            future = Future()
+            index = self._select_worker()
+            self._deques[index].append((future, fn, args, kwargs))
+            if self._threads[index] is None:
+                self._start_worker(index)
+            self._wakeups[index].set()
+
+        return future
+
+    def _select_worker(self):
+        # Round-robin from the last choice, so that ties between idle
+        # workers are spread across the pool.
+        best = None
+        best_load = None
+        for offset in range(self._max_workers):
+            index = (self._next_worker + offset) % self._max_workers
+            load = len(self._deques[index]) + self._busy[index]
+            if best_load is None or load < best_load:
+                best = index
+                best_load = load
+                if load == 0:
+                    break
+
+        self._next_worker = (best + 1) % self._max_workers
+        return best
+
+    def _start_worker(self, index):
+        thread = threading.Thread(
+            name='{}-{}'.format(self._thread_name_prefix, index),
+            target=self._work,
+            args=(index,))
+        thread.daemon = True
+        self._threads[index] = thread
+        thread.start()
+
+    def _take(self, index):
+        try:
+            return self._deques[index].popleft()
+        except IndexError:
+            pass
+
+        for offset in range(1, self._max_workers):
+            victim = self._deques[(index + offset) % self._max_workers]
+            try:
+                return victim.popleft()
+            except IndexError:
+                continue
+
+        return None
+
+    def _next_task(self, index):
+        # Taking a task and marking the worker busy happen under the submit
+        # lock, so submit() never sees a worker that is about to sleep as
+        # loaded, nor an idle one holding a task.
+        with self._submit_lock:
+            work = self._take(index)
+            self._busy[index] = work is not None
+        return work
+
+    def _work(self, index):
+        wakeup = self._wakeups[index]
+        while True:
+            # Clear before looking for work, so that a task submitted after
+            # the search leaves the event set and the wait returns at once.
+            wakeup.clear()
+            work = self._next_task(index)
+            if work is None:
+                if self._shutdown:
+                    return
+                wakeup.wait()
+                continue
+
+            future, fn, args, kwargs = work
+            if not future.set_running_or_notify_cancel():
+                self._busy[index] = False
+                continue
+
+            try:
+                result = fn(*args, **kwargs)
+            # pylint: disable=broad-except
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+            finally:
+                self._busy[index] = False
+
+    def shutdown(self, wait=True):
+        with self._submit_lock:
+            self._shutdown = True
+            for wakeup in self._wakeups:
+                wakeup.set()
+
+        if wait:
+            for thread in self._threads:
+                if thread is not None:
+                    thread.join()
+
+
 class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
 
-    def __init__(self, max_workers=None, name='', trace=None):
+    def __init__(self, max_workers=None, name='', trace=None,
+                 work_stealing=False):
         if trace is None:
             self._trace = 'SAWTOOTH_TRACE_LOGGING' in os.environ
         else:
@@ -50,6 +190,12 @@ class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
             self._max_workers = multiprocessing.cpu_count() * 5
         super().__init__(max_workers)
 
+        self._work_stealing_executor = None
+        if work_stealing:
+            self._work_stealing_executor = WorkStealingThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix=self._name)
+
     def submit(self, fn, *args, **kwargs):
         submitted_time = time.time()
 
@@ -110,4 +256,13 @@ class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
 
             return return_value
 
+        if self._work_stealing_executor is not None:
+            return self._work_stealing_executor.submit(wrapper)
+
         return super().submit(wrapper)
+
+    def shutdown(self, wait=True):
+        if self._work_stealing_executor is not None:
+            self._work_stealing_executor.shutdown(wait=wait)
+
+        super().shutdown(wait=wait)
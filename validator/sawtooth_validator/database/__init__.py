@@ -16,4 +16,5 @@
 __all__ = [
     'database',
     'indexed_database',
+    'lmdb_environment',
     'lmdb_nolock_database']
@@ -40,6 +40,10 @@ class IndexedDatabase(database.Database):
     def __init__(self, filename, serializer, deserializer,
                  indexes=None,
                  flag=None,
+                 writemap=True,
+                 metasync=True,
+                 sync=True,
+                 readahead=True,
                  _size=DEFAULT_SIZE):
         """Constructor for the IndexedDatabase class.
 
@@ -54,6 +58,14 @@ class IndexedDatabase(database.Database):
             flag (str:optional): a flag indicating the mode for opening the
                 database.  Refer to the documentation for anydbm.open().
                 Defaults to None.
+            writemap (bool:optional): write directly to the memory map
+                (MDB_WRITEMAP). Defaults to True.
+            metasync (bool:optional): flush the meta page on each commit
+                (unset for MDB_NOMETASYNC). Defaults to True.
+            sync (bool:optional): flush buffers to disk on each commit
+                (unset for MDB_NOSYNC). Defaults to True.
+            readahead (bool:optional): allow OS readahead on the memory map
+                (unset for MDB_NORDAHEAD). Defaults to True.
         """
         super(IndexedDatabase, self).__init__()
 
@@ -67,25 +79,97 @@ class IndexedDatabase(database.Database):
         if indexes is None:
             indexes = {}
 
-        self._serializer = serializer
-        self._deserializer = deserializer
-
         self._lmdb = lmdb.Environment(path=filename,
                                       map_size=_size,
                                       map_async=True,
-                                      writemap=True,
+                                      writemap=writemap,
+                                      metasync=metasync,
+                                      sync=sync,
+                                      readahead=readahead,
                                       subdir=False,
                                       create=create,
                                       max_dbs=len(indexes) + 1,
                                       lock=True)
+        self._owns_env = True
+
+        self._init_databases('', serializer, deserializer, indexes)
+
+    @classmethod
+    def from_environment(cls, lmdb_env, name, serializer, deserializer,
+                         indexes=None):
+        """Constructs an IndexedDatabase whose main and index databases are
+        named databases within an existing environment, prefixed by the
+        given name. The environment is shared, so closing the returned
+        instance leaves it open.
+
+        Args:
+            lmdb_env (lmdb.Environment): an open environment, with room for
+                the main database and one database per index.
+            name (str): the prefix for the database names.
+            serializer (function): converts entries to bytes
+            deserializer (function): restores items from bytes
+            indexes (dict:(str,function):optional): dict of index names to key
+                functions, as in the constructor. Defaults to None
+
+        Returns:
+            IndexedDatabase: the database bound to the named databases.
+        """
+        # pylint: disable=protected-access
+        instance = cls.__new__(cls)
+        database.Database.__init__(instance)
+        instance._lmdb = lmdb_env
+        instance._owns_env = False
+        instance._init_databases(
+            '{}_'.format(name), serializer, deserializer,
+            indexes if indexes is not None else {})
+        return instance
+
+    def import_legacy(self, filename):
+        """Copies the records and index entries of a standalone database
+        file, as created by the constructor, into this database. Keys already
+        present in this database keep their current values, so an
+        interrupted import can be repeated.
+
+        Args:
+            filename (str): the filename of the standalone database file.
+        """
+        databases = [(b'main', self._main_db)] + [
+            ('index_{}'.format(name).encode(), index_db)
+            for name, (index_db, _) in self._indexes.items()]
+
+        legacy = lmdb.Environment(path=filename,
+                                  subdir=False,
+                                  readonly=True,
+                                  lock=False,
+                                  max_dbs=len(databases))
+        try:
+            with legacy.begin() as legacy_txn, \
+                    self._lmdb.begin(write=True) as txn:
+                for legacy_name, dbi in databases:
+                    legacy_dbi = legacy.open_db(
+                        legacy_name,
+                        txn=legacy_txn,
+                        create=False,
+                        integerkey=dbi.flags(txn)['integerkey'])
+                    txn.cursor(dbi).putmulti(
+                        legacy_txn.cursor(legacy_dbi).iternext(),
+                        overwrite=False)
+        finally:
+            legacy.close()
+        self.sync()
+
+    def _init_databases(self, prefix, serializer, deserializer, indexes):
+        self._serializer = serializer
+        self._deserializer = deserializer
 
-        self._main_db = self._lmdb.open_db('main'.encode())
+        self._main_db = self._lmdb.open_db(
+            '{}main'.format(prefix).encode())
 
         self._indexes = \
-            {name: self._make_index_tuple(name, index_info)
+            {name: self._make_index_tuple(prefix, name, index_info)
              for name, index_info in indexes.items()}
 
-    def _make_index_tuple(self, name, index_info):
+    def _make_index_tuple(self, prefix, name, index_info):
         if callable(index_info):
             key_fn = index_info
             integerkey = False
@@ -98,7 +182,8 @@ class IndexedDatabase(database.Database):
                 'Index {} must be defined as a function or a dict'.format(
                     name))
 
-        return (self._lmdb.open_db('index_{}'.format(name).encode(),
+        index_db_name = '{}index_{}'.format(prefix, name)
+        return (self._lmdb.open_db(index_db_name.encode(),
                                    integerkey=integerkey),
                 key_fn)
 
@@ -193,8 +278,9 @@ class IndexedDatabase(database.Database):
                         if index_cursor.set_key(idx_key):
                             index_cursor.delete()
 
-            # process all the inserts
-            for key, value in puts:
+            # process all the inserts, in key order so that consecutive
+            # puts land on neighbouring pages of the B-tree
+            for key, value in sorted(puts, key=lambda item: item[0]):
                 packed = self._serializer(value)
 
                 cursor.put(key.encode(), packed, overwrite=True)
@@ -215,7 +301,8 @@ class IndexedDatabase(database.Database):
     def close(self):
         """Closes the connection to the database
         """
-        self._lmdb.close()
+        if self._owns_env:
+            self._lmdb.close()
 
     def keys(self, index=None):
         """Returns a list of keys in the database
@@ -0,0 +1,110 @@
+# Copyright 2017 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import os
+import lmdb
+
+from sawtooth_validator.database.indexed_database import IndexedDatabase
+from sawtooth_validator.database.lmdb_nolock_database import \
+    DEFAULT_MAP_SIZE
+from sawtooth_validator.database.lmdb_nolock_database import \
+    LMDBNoLockDatabase
+
+
+DEFAULT_MAX_DBS = 16
+
+
+class LMDBEnvironment(object):
+    """LMDBEnvironment wraps a single LMDB environment which holds several
+    named databases. Databases opened from the same environment share one
+    memory map, lock file and writer lock, so the stores backed by them
+    cost one fsync per commit rather than one per file.
+    """
+
+    def __init__(self, filename, flag, max_dbs=DEFAULT_MAX_DBS,
+                 writemap=True, metasync=True, sync=True, readahead=True,
+                 map_size=DEFAULT_MAP_SIZE):
+        """Constructor for the LMDBEnvironment class.
+
+        Args:
+            filename (str): The filename of the environment file.
+            flag (str): a flag indicating the mode for opening the
+                environment. Refer to the documentation for anydbm.open().
+            max_dbs (int): the maximum number of named databases, counting
+                each index of an indexed database.
+            writemap (bool): see LMDBNoLockDatabase.
+            metasync (bool): see LMDBNoLockDatabase.
+            sync (bool): see LMDBNoLockDatabase.
+            readahead (bool): see LMDBNoLockDatabase.
+            map_size (int): the size in bytes of the memory map, shared by
+                every database of the environment. See LMDBNoLockDatabase.
+        """
+        create = bool(flag == 'c')
+
+        if flag == 'n':
+            if os.path.isfile(filename):
+                os.remove(filename)
+            create = True
+
+        self._lmdb = lmdb.Environment(path=filename,
+                                      map_size=map_size,
+                                      map_async=True,
+                                      writemap=writemap,
+                                      metasync=metasync,
+                                      sync=sync,
+                                      readahead=readahead,
+                                      subdir=False,
+                                      create=create,
+                                      max_dbs=max_dbs,
+                                      lock=True)
+
+    def open_dbi(self, name):
+        """Opens a named database within this environment.
+
+        Args:
+            name (str): the name of the database.
+
+        Returns:
+            LMDBNoLockDatabase: the database.
+        """
+        return LMDBNoLockDatabase.from_environment(self._lmdb, name)
+
+    def open_indexed_dbi(self, name, serializer, deserializer, indexes=None):
+        """Opens a named, indexed database within this environment. The
+        main database and each index use a database of their own, prefixed
+        by the given name.
+
+        Args:
+            name (str): the name of the database.
+            serializer (function): converts entries to bytes
+            deserializer (function): restores items from bytes
+            indexes (dict:(str,function):optional): dict of index names to key
+                functions. See IndexedDatabase.
+
+        Returns:
+            IndexedDatabase: the database.
+        """
+        return IndexedDatabase.from_environment(
+            self._lmdb, name, serializer, deserializer, indexes=indexes)
+
+    def sync(self):
+        """Ensures that pending writes are flushed to disk
+        """
+        self._lmdb.sync()
+
+    def close(self):
+        """Closes the environment, and with it every database opened from it
+        """
+        self._lmdb.close()
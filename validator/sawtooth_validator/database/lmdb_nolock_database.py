@@ -20,6 +20,9 @@ import cbor
 from sawtooth_validator.database import database
 
 
+DEFAULT_MAP_SIZE = 1024**4
+
+
 class LMDBNoLockDatabase(database.Database):
     """LMDBNoLockDatabase is an implementation of the
     sawtooth_validator.database.Database interface which uses LMDB for the
@@ -27,15 +30,32 @@ class LMDBNoLockDatabase(database.Database):
 
     Attributes:
        _lmdb (lmdb.Environment): The underlying lmdb database.
+       _db (lmdb._Database): The handle of the database within the
+           environment that this instance reads and writes.
     """
 
-    def __init__(self, filename, flag):
+    def __init__(self, filename, flag, writemap=True, metasync=True,
+                 sync=True, readahead=True, map_size=DEFAULT_MAP_SIZE):
         """Constructor for the LMDBNoLockDatabase class.
 
         Args:
             filename (str): The filename of the database file.
             flag (str): a flag indicating the mode for opening the database.
                 Refer to the documentation for anydbm.open().
+            writemap (bool): write directly to the memory map, rather than
+                through write() syscalls (MDB_WRITEMAP). Defaults to True.
+            metasync (bool): flush the meta page on each commit; if False,
+                the meta page is flushed with the next data flush
+                (MDB_NOMETASYNC). Defaults to True.
+            sync (bool): flush buffers to disk on each commit; if False,
+                a system crash may undo the most recent commits
+                (MDB_NOSYNC). Defaults to True.
+            readahead (bool): allow the OS to read ahead when reading
+                the memory map (MDB_NORDAHEAD). Defaults to True.
+            map_size (int): the size in bytes of the memory map, which
+                bounds the size of the database. The map is sparse, so this
+                reserves address space rather than disk. Defaults to
+                DEFAULT_MAP_SIZE.
         """
         super(LMDBNoLockDatabase, self).__init__()
 
@@ -47,24 +67,72 @@ class LMDBNoLockDatabase(database.Database):
             create = True
 
         self._lmdb = lmdb.Environment(path=filename,
-                                      map_size=1024**4,
+                                      map_size=map_size,
                                       map_async=True,
-                                      writemap=True,
+                                      writemap=writemap,
+                                      metasync=metasync,
+                                      sync=sync,
+                                      readahead=readahead,
                                       subdir=False,
                                       create=create,
                                       lock=True)
+        self._db = self._lmdb.open_db()
+        self._owns_env = True
+
+    @classmethod
+    def from_environment(cls, lmdb_env, name):
+        """Constructs an LMDBNoLockDatabase backed by a named database within
+        an existing environment. The environment is shared, so closing the
+        returned instance leaves it open.
+
+        Args:
+            lmdb_env (lmdb.Environment): an open environment, with room for
+                at least one more named database.
+            name (str): the name of the database within the environment.
+
+        Returns:
+            LMDBNoLockDatabase: the database bound to the named database.
+        """
+        # pylint: disable=protected-access
+        instance = cls.__new__(cls)
+        database.Database.__init__(instance)
+        instance._lmdb = lmdb_env
+        instance._db = lmdb_env.open_db(name.encode())
+        instance._owns_env = False
+        return instance
+
+    def import_legacy(self, filename):
+        """Copies the records of a standalone database file, as created by
+        the constructor, into this database. Keys already present in this
+        database keep their current values, so an interrupted import can be
+        repeated.
+
+        Args:
+            filename (str): the filename of the standalone database file.
+        """
+        legacy = lmdb.Environment(path=filename,
+                                  subdir=False,
+                                  readonly=True,
+                                  lock=False)
+        try:
+            with legacy.begin() as legacy_txn, \
+                    self._lmdb.begin(write=True, db=self._db) as txn:
+                txn.cursor(self._db).putmulti(
+                    legacy_txn.cursor().iternext(), overwrite=False)
+        finally:
+            legacy.close()
+        self.sync()
 
-    # pylint: disable=no-value-for-parameter
     def __len__(self):
-        with self._lmdb.begin() as txn:
-            return txn.stat()['entries']
+        with self._lmdb.begin(db=self._db) as txn:
+            return txn.stat(self._db)['entries']
 
     def contains_key(self, key, index=None):
-        with self._lmdb.begin() as txn:
+        with self._lmdb.begin(db=self._db) as txn:
             return bool(txn.get(key.encode()) is not None)
 
     def get_multi(self, keys, index=None):
-        with self._lmdb.begin() as txn:
+        with self._lmdb.begin(db=self._db) as txn:
             result = []
             for key in keys:
                 packed = txn.get(key.encode())
@@ -79,10 +147,13 @@ class LMDBNoLockDatabase(database.Database):
         raise NotImplementedError()
 
     def update(self, puts, deletes):
-        with self._lmdb.begin(write=True, buffers=True) as txn:
+        with self._lmdb.begin(
+                write=True, buffers=True, db=self._db) as txn:
             for k in deletes:
                 txn.delete(k.encode())
-            for k, v in puts:
+            # Writing in key order keeps consecutive puts on neighbouring
+            # pages of the B-tree.
+            for k, v in sorted(puts, key=lambda item: item[0]):
                 packed = cbor.dumps(v)
                 txn.put(k.encode(), packed, overwrite=True)
         self.sync()
@@ -93,7 +164,8 @@ class LMDBNoLockDatabase(database.Database):
         Args:
             key (str): The key to remove.
         """
-        with self._lmdb.begin(write=True, buffers=True) as txn:
+        with self._lmdb.begin(
+                write=True, buffers=True, db=self._db) as txn:
             txn.delete(key.encode())
 
     def sync(self):
@@ -104,10 +176,11 @@ class LMDBNoLockDatabase(database.Database):
     def close(self):
         """Closes the connection to the database
         """
-        self._lmdb.close()
+        if self._owns_env:
+            self._lmdb.close()
 
     def keys(self, index=None):
         """Returns a list of keys in the database
         """
-        with self._lmdb.begin() as txn:
+        with self._lmdb.begin(db=self._db) as txn:
             return [key.decode() for key, _ in txn.cursor()]
@@ -13,6 +13,8 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 import logging
+import threading
+from collections import OrderedDict
 
 from google.protobuf.message import DecodeError
 
@@ -435,11 +437,24 @@ class NetworkConsensusPermissionHandler(Handler):
 
 
 class IdentityCache():
-    def __init__(self, identity_view_factory, current_root_func):
+    def __init__(self, identity_view_factory, current_root_func,
+                 thread_local_cache_size=0):
+        """
+        Args:
+            thread_local_cache_size (int): the number of entries each thread
+                keeps in front of the shared cache, so that threads looking
+                up the same identities do not contend on one dict. A size of
+                0 disables the per-thread caches.
+        """
         self._identity_view_factory = identity_view_factory
         self._identity_view = None
         self._current_root_func = current_root_func
         self._cache = {}
+        self._thread_local_cache_size = thread_local_cache_size
+        self._local = threading.local()
+        # Bumped whenever shared entries are removed; a thread discards its
+        # local cache when it sees a generation other than its own.
+        self._generation = 0
 
     def __len__(self):
         return len(self._cache)
@@ -454,29 +469,73 @@ class IdentityCache():
         return iter(self._cache)
 
     def get_role(self, item, state_root):
+        generation = self._generation
+        value = self._get_local(item)
+        if value is not None:
+            return value
+
         value = self._cache.get(item)
         if value is None:
             if self._identity_view is None:
                 self.update_view(state_root)
             value = self._identity_view.get_role(item)
             self._cache[item] = value
+        self._put_local(item, value, generation)
         return value
 
     def get_policy(self, item, state_root):
+        generation = self._generation
+        value = self._get_local(item)
+        if value is not None:
+            return value
+
         value = self._cache.get(item)
         if value is None:
             if self._identity_view is None:
                 self.update_view(state_root)
             value = self._identity_view.get_policy(item)
             self._cache[item] = value
+        self._put_local(item, value, generation)
         return value
 
     def forked(self):
         self._cache = {}
+        self._generation += 1
 
     def invalidate(self, item):
         if item in self._cache:
             del self._cache[item]
+        self._generation += 1
+
+    def _local_cache(self):
+        local = self._local
+        if getattr(local, 'generation', None) != self._generation:
+            local.cache = OrderedDict()
+            local.generation = self._generation
+        return local.cache
+
+    def _get_local(self, item):
+        if not self._thread_local_cache_size:
+            return None
+
+        cache = self._local_cache()
+        value = cache.get(item)
+        if value is not None:
+            cache.move_to_end(item)
+        return value
+
+    def _put_local(self, item, value, generation):
+        # Skip values read before a concurrent invalidation, as they may
+        # be stale.
+        if not self._thread_local_cache_size or value is None \
+                or generation != self._generation:
+            return
+
+        cache = self._local_cache()
+        cache[item] = value
+        cache.move_to_end(item)
+        if len(cache) > self._thread_local_cache_size:
+            cache.popitem(last=False)
 
     def update_view(self, state_root):
         self._identity_view = \
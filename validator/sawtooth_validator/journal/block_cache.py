@@ -13,6 +13,7 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+from collections import OrderedDict
 from collections.abc import MutableMapping
 from threading import RLock
 import time
@@ -20,12 +21,30 @@ import time
 from sawtooth_validator.journal.block_wrapper import NULL_BLOCK_IDENTIFIER
 
 
+# The fraction of a 2Q cache's entries that may be held on probation
+TWO_QUEUE_PROBATION_FRACTION = 0.25
+
+
 class BlockCache(MutableMapping):
     """
     A dict like interface to access blocks. Stores BlockState objects.
+
+    Entries are purged once they have not been accessed for keep_time
+    seconds. With the '2Q' policy, the cache is also held to max_entries:
+    new entries are admitted on probation, in FIFO order, and are promoted
+    to a protected LRU queue when accessed again. Once the cache is full,
+    entries are evicted from the probation queue first, so a single scan
+    over old blocks does not flush the blocks in regular use. Only blocks
+    which can be reloaded from the block store are evicted this way.
     """
 
+    __slots__ = ('_lock', '_cache', '_keep_time', '_purge_frequency',
+                 '_next_purge_time', '_block_store', '_policy', '_max_entries',
+                 '_probation', '_protected', '_pinned', '_max_probation')
+
     class CachedValue(object):
+        __slots__ = ('value', 'timestamp', 'count')
+
         def __init__(self, value):
             self.value = value
             self.timestamp = time.time()  # the time this State was created,
@@ -47,8 +66,14 @@ class BlockCache(MutableMapping):
                 self.count -= 1
             self.touch()
 
-    def __init__(self, block_store=None, keep_time=30, purge_frequency=30):
+    def __init__(self, block_store=None, keep_time=30, purge_frequency=30,
+                 policy=None, max_entries=None):
         super(BlockCache, self).__init__()
+        if policy not in (None, '2Q'):
+            raise ValueError('Unknown block cache policy: {}'.format(policy))
+        if policy == '2Q' and (max_entries is None or max_entries < 1):
+            raise ValueError('The 2Q policy requires max_entries')
+
         self._lock = RLock()
         self._cache = {}
         self._keep_time = keep_time
@@ -56,6 +81,17 @@ class BlockCache(MutableMapping):
         self._next_purge_time = time.time() + purge_frequency
         self._block_store = block_store if block_store is not None else {}
 
+        self._policy = policy
+        self._max_entries = max_entries
+        self._probation = OrderedDict()
+        self._protected = OrderedDict()
+        # Entries found to be unevictable, held out of the 2Q queues until
+        # the next purge finds them in the block store
+        self._pinned = OrderedDict()
+        if policy == '2Q':
+            self._max_probation = \
+                max(1, int(max_entries * TWO_QUEUE_PROBATION_FRACTION))
+
     @property
     def block_store(self):
         """
@@ -69,6 +105,7 @@ class BlockCache(MutableMapping):
             try:
                 value = self._cache[block_id]
                 value.touch()
+                self._record_access(block_id)
                 return value.value
             except KeyError:
                 if block_id in self._block_store:
@@ -79,11 +116,16 @@ class BlockCache(MutableMapping):
 
     def __setitem__(self, block_id, block):
         with self._lock:
+            if block_id in self._cache:
+                self._record_access(block_id)
+            else:
+                self._admit(block_id)
             self._cache[block_id] = self.CachedValue(block)
             if block_id != NULL_BLOCK_IDENTIFIER and \
                     block.previous_block_id in self._cache:
                 self._cache[block.previous_block_id].inc_count()
 
+            self._evict_overflow()
             if time.time() > self._next_purge_time:
                 self._purge_expired()
                 self._next_purge_time = time.time() + self._purge_frequency
@@ -94,6 +136,7 @@ class BlockCache(MutableMapping):
             if block.previous_block_id in self._cache:
                 self._cache[block.previous_block_id].dec_count()
             del self._cache[block_id]
+            self._forget(block_id)
 
     def __iter__(self):
         with self._lock:
@@ -120,10 +163,12 @@ class BlockCache(MutableMapping):
             for block in chain:
                 block_id = block.header_signature
                 if block_id not in self._cache:
+                    self._admit(block_id)
                     self._cache[block_id] = self.CachedValue(block)
                     if block.previous_block_id in self._cache:
                         self._cache[block.previous_block_id].inc_count()
 
+            self._evict_overflow()
             if time.time() > self._next_purge_time:
                 self._purge_expired()
                 self._next_purge_time = time.time() + self._purge_frequency
@@ -141,6 +186,85 @@ class BlockCache(MutableMapping):
         with self._lock:
             return self._purge_frequency
 
+    @property
+    def max_entries(self):
+        return self._max_entries
+
+    def _admit(self, block_id):
+        if self._policy == '2Q':
+            self._probation[block_id] = None
+
+    def _record_access(self, block_id):
+        if self._policy != '2Q':
+            return
+
+        if block_id in self._protected:
+            self._protected.move_to_end(block_id)
+        elif block_id in self._probation:
+            del self._probation[block_id]
+            self._protected[block_id] = None
+
+    def _forget(self, block_id):
+        self._probation.pop(block_id, None)
+        self._protected.pop(block_id, None)
+        self._pinned.pop(block_id, None)
+
+    def _eviction_candidates(self):
+        if len(self._probation) > self._max_probation:
+            yield from self._probation
+        yield from self._protected
+        yield from self._probation
+
+    def _is_evictable(self, block_id):
+        return self._cache[block_id].value is not None and \
+            block_id in self._block_store
+
+    def _unpin_stored(self):
+        """
+        Return pinned entries which can now be reloaded from the block store
+        to the probation queue.
+        """
+        for block_id in [block_id for block_id in self._pinned
+                         if self._is_evictable(block_id)]:
+            del self._pinned[block_id]
+            self._probation[block_id] = None
+
+    def _evict_overflow(self):
+        """
+        Evict entries, in 2Q order, until the cache holds no more than
+        max_entries. Entries that cannot be reloaded from the block store are
+        never evicted here, so the cache may stay over its limit while it
+        holds more of those than max_entries. They are moved out of the 2Q
+        queues when first found, so later evictions do not examine them
+        again.
+        """
+        if self._policy != '2Q':
+            return
+
+        while len(self._cache) > self._max_entries:
+            victim = None
+            unevictable = OrderedDict()
+            for block_id in self._eviction_candidates():
+                if block_id in unevictable:
+                    continue
+                if self._is_evictable(block_id):
+                    victim = block_id
+                    break
+                unevictable[block_id] = None
+
+            for block_id in unevictable:
+                self._probation.pop(block_id, None)
+                self._protected.pop(block_id, None)
+                self._pinned[block_id] = None
+
+            if victim is None:
+                return
+
+            block = self._cache.pop(victim).value
+            self._forget(victim)
+            if block.previous_block_id in self._cache:
+                self._cache[block.previous_block_id].dec_count()
+
     def _purge_expired(self):
         """
         Remove all expired entries from the cache that do not have a reference
@@ -170,7 +294,12 @@ class BlockCache(MutableMapping):
                 if block is not None:
                     dec_count_for.append(block.previous_block_id)
 
+        for block_id in self._cache:
+            if block_id not in new_cache:
+                self._forget(block_id)
+
         self._cache = new_cache
+        self._unpin_stored()
         for block_id in dec_count_for:
             if block_id in self._cache:
                 self._cache[block_id].dec_count()
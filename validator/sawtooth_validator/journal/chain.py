@@ -99,7 +99,8 @@ class BlockValidator(object):
                  identity_signer,
                  data_dir,
                  config_dir,
-                 permission_verifier):
+                 permission_verifier,
+                 identity_public_key=None):
         """Initialize the BlockValidator
         Args:
              consensus_module: The consensus module that contains
@@ -118,6 +119,8 @@ class BlockValidator(object):
              consensus module can be stored.
              config_dir: Path to location where config data for the
              consensus module can be found.
+             identity_public_key: The hex-encoded public key of
+             identity_signer, if already known.
         Returns:
             None
         """
@@ -136,6 +139,9 @@ class BlockValidator(object):
         self._executor = executor
         self._squash_handler = squash_handler
         self._identity_signer = identity_signer
+        if identity_public_key is None:
+            identity_public_key = identity_signer.get_public_key().as_hex()
+        self._identity_public_key = identity_public_key
         self._data_dir = data_dir
         self._config_dir = config_dir
         self._result = {
@@ -295,14 +301,12 @@ class BlockValidator(object):
                 valid = self._validate_permissions(blkw)
 
                 if valid:
-                    public_key = \
-                        self._identity_signer.get_public_key().as_hex()
                     consensus = self._consensus_module.BlockVerifier(
                         block_cache=self._block_cache,
                         state_view_factory=self._state_view_factory,
                         data_dir=self._data_dir,
                         config_dir=self._config_dir,
-                        validator_id=public_key)
+                        validator_id=self._identity_public_key)
                     valid = consensus.verify_block(blkw)
 
                 if valid:
@@ -407,13 +411,12 @@ class BlockValidator(object):
     def _test_commit_new_chain(self):
         """ Compare the two chains and determine which should be the head.
         """
-        public_key = self._identity_signer.get_public_key().as_hex()
         fork_resolver = self._consensus_module.\
             ForkResolver(block_cache=self._block_cache,
                          state_view_factory=self._state_view_factory,
                          data_dir=self._data_dir,
                          config_dir=self._config_dir,
-                         validator_id=public_key)
+                         validator_id=self._identity_public_key)
 
         return fork_resolver.compare_forks(self._chain_head, self._new_block)
 
@@ -572,7 +575,8 @@ class ChainController(object):
                  permission_verifier,
                  chain_observers,
                  thread_pool=None,
-                 metrics_registry=None):
+                 metrics_registry=None,
+                 identity_public_key=None):
         """Initialize the ChainController
         Args:
             block_cache: The cache of all recent blocks and the processing
@@ -600,6 +604,8 @@ class ChainController(object):
                 consensus module can be found.
             chain_observers (list of :obj:`ChainObserver`): A list of chain
                 observers.
+            identity_public_key (str): The hex-encoded public key of
+                identity_signer, if already known.
         Returns:
             None
         """
@@ -613,6 +619,9 @@ class ChainController(object):
         self._notify_on_chain_updated = on_chain_updated
         self._squash_handler = squash_handler
         self._identity_signer = identity_signer
+        if identity_public_key is None:
+            identity_public_key = identity_signer.get_public_key().as_hex()
+        self._identity_public_key = identity_public_key
         self._data_dir = data_dir
         self._config_dir = config_dir
 
@@ -713,7 +722,8 @@ class ChainController(object):
                 identity_signer=self._identity_signer,
                 data_dir=self._data_dir,
                 config_dir=self._config_dir,
-                permission_verifier=self._permission_verifier)
+                permission_verifier=self._permission_verifier,
+                identity_public_key=self._identity_public_key)
             self._blocks_processing[blkw.block.header_signature] = validator
             self._thread_pool.submit(validator.run)
 
@@ -938,7 +948,8 @@ class ChainController(object):
                     identity_signer=self._identity_signer,
                     data_dir=self._data_dir,
                     config_dir=self._config_dir,
-                    permission_verifier=self._permission_verifier)
+                    permission_verifier=self._permission_verifier,
+                    identity_public_key=self._identity_public_key)
 
                 valid = validator.validate_block(block)
                 if valid:
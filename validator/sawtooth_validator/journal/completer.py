@@ -45,6 +45,11 @@ class Completer(object):
     have their dependencies satisifed, otherwise it will request the batch that
     has the missing transaction.
     """
+    __slots__ = ('gossip', 'batch_cache', 'block_cache', 'lock',
+                 '_block_store', '_seen_txns', '_incomplete_batches',
+                 '_incomplete_blocks', '_requested', '_on_block_received',
+                 '_on_batch_received', '_has_block')
+
     def __init__(self,
                  block_store,
                  gossip,
@@ -405,7 +405,8 @@ class BlockPublisher(object):
                  check_publish_block_frequency,
                  batch_observers,
                  batch_injector_factory=None,
-                 metrics_registry=None):
+                 metrics_registry=None,
+                 identity_public_key=None):
         """
         Initialize the BlockPublisher object
 
@@ -430,6 +431,8 @@ class BlockPublisher(object):
                 for creating BatchInjectors.
             metrics_registry (MetricsRegistry): Metrics registry used to
                 create pending batch gauge
+            identity_public_key (str): The hex-encoded public key of
+                identity_signer, if already known.
         """
         self._lock = RLock()
         self._candidate_block = None  # _CandidateBlock helper,
@@ -446,6 +449,9 @@ class BlockPublisher(object):
         self._chain_head = chain_head  # block (BlockWrapper)
         self._squash_handler = squash_handler
         self._identity_signer = identity_signer
+        if identity_public_key is None:
+            identity_public_key = identity_signer.get_public_key().as_hex()
+        self._identity_public_key = identity_public_key
         self._data_dir = data_dir
         self._config_dir = config_dir
         self._permission_verifier = permission_verifier
@@ -507,7 +513,7 @@ class BlockPublisher(object):
             'sawtooth.publisher.max_batches_per_block',
             default_value=0, value_type=int)
 
-        public_key = self._identity_signer.get_public_key().as_hex()
+        public_key = self._identity_public_key
         consensus = consensus_module.\
             BlockPublisher(block_cache=self._block_cache,
                            state_view_factory=self._state_view_factory,
@@ -75,8 +75,11 @@ class TransactionReceiptStore(ChainObserver):
         return txn_receipt
 
     def chain_update(self, block, receipts):
-        for receipt in receipts:
-            self.put(receipt.transaction_id, receipt)
+        # Write the block's receipts in a single transaction
+        self._receipt_db.update(
+            [(receipt.transaction_id, receipt.SerializeToString())
+             for receipt in receipts],
+            [])
 
 
 class ClientReceiptGetRequestHandler(Handler):
@@ -31,6 +31,8 @@ CACHE_KEEP_TIME = 300
 
 
 class Responder(object):
+    __slots__ = ('completer', 'pending_requests', '_lock')
+
     def __init__(self,
                  completer,
                  cache_keep_time=300,
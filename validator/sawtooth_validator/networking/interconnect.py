@@ -470,8 +470,7 @@ class _SendReceive(object):
             if socket_type == zmq.DEALER:
                 self._socket.identity = "{}-{}".format(
                     self._zmq_identity,
-                    hashlib.sha512(uuid.uuid4().hex.encode()
-                                   ).hexdigest()[:23]).encode('ascii')
+                    uuid.uuid4().hex[:23]).encode('ascii')
 
                 if self._secured:
                     # Generate ephemeral certificates for this connection
@@ -30,7 +30,6 @@ from sawtooth_validator.config.validator import load_toml_validator_config
 from sawtooth_validator.config.validator import merge_validator_config
 from sawtooth_validator.config.validator import ValidatorConfig
 from sawtooth_validator.config.logs import get_log_config
-from sawtooth_validator.server.core import Validator
 from sawtooth_validator.server.keys import load_identity_signer
 from sawtooth_validator.server.log import init_console_logging
 from sawtooth_validator.server.log import log_configuration
@@ -285,6 +284,13 @@ def main(args=None):
                 init_errors = True
                 break
 
+    block_cache_size = validator_config.block_cache_size
+    if isinstance(block_cache_size, bool) or \
+            not isinstance(block_cache_size, int) or block_cache_size < 1:
+        LOGGER.error("block_cache_size must be a positive integer, not %r",
+                     block_cache_size)
+        init_errors = True
+
     if init_errors:
         LOGGER.error("Initialization errors occurred (see previous log "
                      "ERROR messages), shutting down.")
@@ -329,6 +335,11 @@ def main(args=None):
             password=validator_config.opentsdb_password)
         metrics_reporter.start()
 
+    # The validator pulls in the journal, gossip and networking modules, so
+    # it is imported only once the arguments and configuration are known to
+    # be good.
+    from sawtooth_validator.server.core import Validator
+
     validator = Validator(bind_network,
                           bind_component,
                           endpoint,
@@ -345,7 +356,8 @@ def main(args=None):
                           validator_config.network_public_key,
                           validator_config.network_private_key,
                           roles=validator_config.roles,
-                          metrics_registry=wrapped_registry
+                          metrics_registry=wrapped_registry,
+                          block_cache_size=block_cache_size
                           )
 
     # pylint: disable=broad-except
@@ -13,18 +13,20 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
-import hashlib
 import logging
 import os
 import signal
 import time
 import threading
 
+from concurrent.futures import ThreadPoolExecutor
+
 from sawtooth_validator.concurrent.threadpool import \
     InstrumentedThreadPoolExecutor
+from sawtooth_validator.config.validator import \
+    load_default_validator_config
 from sawtooth_validator.execution.context_manager import ContextManager
-from sawtooth_validator.database.indexed_database import IndexedDatabase
-from sawtooth_validator.database.lmdb_nolock_database import LMDBNoLockDatabase
+from sawtooth_validator.database.lmdb_environment import LMDBEnvironment
 from sawtooth_validator.journal.publisher import BlockPublisher
 from sawtooth_validator.journal.chain import ChainController
 from sawtooth_validator.journal.genesis import GenesisController
@@ -58,15 +60,24 @@ from sawtooth_validator.server import component_handlers
 
 LOGGER = logging.getLogger(__name__)
 
+# The time, in seconds, that stop() waits for the validator's threads to exit
+SHUTDOWN_TIMEOUT = 60
+
 
 class Validator(object):
+    __slots__ = ('_component_dispatcher', '_component_service',
+                 '_component_thread_pool', '_network_dispatcher',
+                 '_network_service', '_network_thread_pool', '_sig_pool',
+                 '_context_manager', '_executor', '_genesis_controller',
+                 '_gossip', '_block_publisher', '_chain_controller')
 
     def __init__(self, bind_network, bind_component, endpoint,
                  peering, seeds_list, peer_list, data_dir, config_dir,
                  identity_signer, scheduler_type, permissions,
                  minimum_peer_connectivity, maximum_peer_connectivity,
                  network_public_key=None, network_private_key=None,
-                 roles=None, metrics_registry=None
+                 roles=None, metrics_registry=None,
+                 block_cache_size=None
                  ):
         """Constructs a validator instance.
 
@@ -92,44 +103,67 @@ class Validator(object):
             config_dir (str): path to the config directory
             identity_signer (str): cryptographic signer the validator uses for
                 signing
+            block_cache_size (int): the maximum number of blocks, which can
+                be reloaded from the block store, to hold in the block cache.
+                Defaults to the block_cache_size validator setting's
+                default.
         """
 
-        # -- Setup Global State Database and Factory -- #
-        global_state_db_filename = os.path.join(
-            data_dir, 'merkle-{}.lmdb'.format(bind_network[-2:]))
+        identity_public_key = identity_signer.get_public_key().as_hex()
+
+        # -- Setup Validator Database Environment -- #
+        # The global state, receipt and block stores are named databases
+        # within a single LMDB environment, which share one memory map and
+        # writer lock.
+        suffix = bind_network[-2:]
+        validator_db_filename = os.path.join(
+            data_dir, 'validator-{}.lmdb'.format(suffix))
         LOGGER.debug(
-            'global state database file is %s', global_state_db_filename)
-        global_state_db = LMDBNoLockDatabase(global_state_db_filename, 'c')
+            'validator database file is %s', validator_db_filename)
+        validator_db_env = LMDBEnvironment(
+            validator_db_filename, 'c', writemap=True, metasync=False,
+            readahead=False)
+
+        # -- Setup Global State Database and Factory -- #
+        global_state_db = validator_db_env.open_dbi('merkle')
+        _migrate_legacy_database(
+            global_state_db, data_dir, 'merkle', suffix)
         state_view_factory = StateViewFactory(global_state_db)
 
         # -- Setup Receipt Store -- #
-        receipt_db_filename = os.path.join(
-            data_dir, 'txn_receipts-{}.lmdb'.format(bind_network[-2:]))
-        LOGGER.debug('txn receipt store file is %s', receipt_db_filename)
-        receipt_db = LMDBNoLockDatabase(receipt_db_filename, 'c')
+        receipt_db = validator_db_env.open_dbi('txn_receipts')
+        _migrate_legacy_database(
+            receipt_db, data_dir, 'txn_receipts', suffix)
         receipt_store = TransactionReceiptStore(receipt_db)
 
         # -- Setup Block Store -- #
-        block_db_filename = os.path.join(
-            data_dir, 'block-{}.lmdb'.format(bind_network[-2:]))
-        LOGGER.debug('block store file is %s', block_db_filename)
-        block_db = IndexedDatabase(
-            block_db_filename,
+        block_db = validator_db_env.open_indexed_dbi(
+            'block',
             BlockStore.serialize_block,
             BlockStore.deserialize_block,
-            flag='c',
             indexes=BlockStore.create_index_configuration())
+        _migrate_legacy_database(
+            block_db, data_dir, 'block', suffix)
         block_store = BlockStore(block_db)
+        if block_cache_size is None:
+            block_cache_size = \
+                load_default_validator_config().block_cache_size
         block_cache = BlockCache(
-            block_store, keep_time=300, purge_frequency=30)
+            block_store, keep_time=1800, purge_frequency=60, policy='2Q',
+            max_entries=block_cache_size)
 
         # -- Setup Thread Pools -- #
+        pool_size = int((os.cpu_count() or 4) * _get_pool_scale())
         component_thread_pool = InstrumentedThreadPoolExecutor(
-            max_workers=10, name='Component')
+            max_workers=max(4, pool_size), name='Component',
+            work_stealing=True)
         network_thread_pool = InstrumentedThreadPoolExecutor(
-            max_workers=10, name='Network')
+            max_workers=max(4, pool_size), name='Network',
+            work_stealing=True)
+        # Only the secp256k1 verify call releases the GIL; decoding and
+        # hashing the headers on these threads still holds it.
         sig_pool = InstrumentedThreadPoolExecutor(
-            max_workers=3, name='Signature')
+            max_workers=max(2, pool_size), name='Signature')
 
         # -- Setup Dispatchers -- #
         component_dispatcher = Dispatcher(metrics_registry=metrics_registry)
@@ -146,8 +180,7 @@ class Validator(object):
             max_future_callback_workers=10,
             metrics_registry=metrics_registry)
 
-        zmq_identity = hashlib.sha512(
-            time.time().hex().encode()).hexdigest()[:23]
+        zmq_identity = os.urandom(12).hex()[:23]
 
         secure = False
         if network_public_key is not None and network_private_key is not None:
@@ -186,7 +219,7 @@ class Validator(object):
         component_service.set_check_connections(executor.check_connections)
 
         event_broadcaster = EventBroadcaster(
-            component_service, block_store, receipt_store)
+            component_service, block_store, receipt_store, lazy=True)
 
         # -- Setup P2P Networking -- #
         gossip = Gossip(
@@ -209,7 +242,8 @@ class Validator(object):
             StateViewFactory(global_state_db))
 
         id_cache = IdentityCache(
-            identity_view_factory, block_store.chain_head_state_root)
+            identity_view_factory, block_store.chain_head_state_root,
+            thread_local_cache_size=256)
 
         # -- Setup Permissioning -- #
         permission_verifier = PermissionVerifier(
@@ -242,7 +276,8 @@ class Validator(object):
             check_publish_block_frequency=0.1,
             batch_observers=[batch_tracker],
             batch_injector_factory=batch_injector_factory,
-            metrics_registry=metrics_registry)
+            metrics_registry=metrics_registry,
+            identity_public_key=identity_public_key)
 
         chain_controller = ChainController(
             block_sender=block_sender,
@@ -263,7 +298,8 @@ class Validator(object):
                 batch_tracker,
                 identity_observer
             ],
-            metrics_registry=metrics_registry)
+            metrics_registry=metrics_registry,
+            identity_public_key=identity_public_key)
 
         genesis_controller = GenesisController(
             context_manager=context_manager,
@@ -325,6 +361,8 @@ class Validator(object):
             self._start()
 
     def _start(self):
+        # The services are started from the main thread: threads they create
+        # inherit the daemon flag of the thread that starts them.
         self._network_dispatcher.start()
         self._network_service.start()
 
@@ -337,9 +375,9 @@ class Validator(object):
         signal.signal(signal.SIGTERM,
                       lambda sig, fr: signal_event.set())
         # This is where the main thread will be during the bulk of the
-        # validator's life.
-        while not signal_event.is_set():
-            signal_event.wait(timeout=20)
+        # validator's life. The wait is interrupted by signals, so both
+        # SIGTERM and Ctrl+C are handled without periodic wakeups.
+        signal_event.wait()
 
     def stop(self):
         self._gossip.stop()
@@ -349,9 +387,10 @@ class Validator(object):
 
         self._component_service.stop()
 
-        self._network_thread_pool.shutdown(wait=True)
-        self._component_thread_pool.shutdown(wait=True)
-        self._sig_pool.shutdown(wait=True)
+        _run_concurrently(
+            lambda: self._network_thread_pool.shutdown(wait=True),
+            lambda: self._component_thread_pool.shutdown(wait=True),
+            lambda: self._sig_pool.shutdown(wait=True))
 
         self._executor.stop()
         self._context_manager.stop()
@@ -365,21 +404,73 @@ class Validator(object):
         # a sys.exit() or exit of main().
         threads.remove(threading.current_thread())
 
-        while threads:
-            if len(threads) < 4:
-                LOGGER.info(
-                    "remaining threads: %s",
-                    ", ".join(
-                        ["{} ({})".format(x.name, x.__class__.__name__)
-                         for x in threads]))
-            for t in threads.copy():
-                if not t.is_alive():
-                    t.join()
-                    threads.remove(t)
-                if threads:
-                    time.sleep(1)
-
-        LOGGER.info("All threads have been stopped and joined")
+        deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+        for t in threads:
+            t.join(timeout=max(0.0, deadline - time.monotonic()))
+
+        stragglers = [t for t in threads if t.is_alive()]
+        if stragglers:
+            LOGGER.info(
+                "remaining threads: %s",
+                ", ".join(
+                    ["{} ({})".format(x.name, x.__class__.__name__)
+                     for x in stragglers]))
+        else:
+            LOGGER.info("All threads have been stopped and joined")
 
     def get_chain_head_state_root_hash(self):
         return self._chain_controller.chain_head.state_root_hash
+
+
+def _migrate_legacy_database(db, data_dir, name, suffix):
+    """Imports a store from the standalone <name>-<suffix>.lmdb file used
+    before the stores shared validator-<suffix>.lmdb, if that file exists.
+    The file is renamed afterwards, so the import runs once, and left in
+    place for the operator to remove.
+    """
+    filename = os.path.join(data_dir, '{}-{}.lmdb'.format(name, suffix))
+    if not os.path.isfile(filename):
+        return
+
+    LOGGER.info('Migrating %s into the validator database', filename)
+    db.import_legacy(filename)
+    os.rename(filename, '{}.migrated'.format(filename))
+    lock_filename = '{}-lock'.format(filename)
+    if os.path.isfile(lock_filename):
+        os.remove(lock_filename)
+    LOGGER.info(
+        'Migrated %s; the old file has been renamed to %s.migrated and can '
+        'be removed', filename, filename)
+
+
+def _run_concurrently(*calls):
+    """Runs each of the given callables on a thread of its own and waits for
+    all of them to return. The first exception raised by a call, if any, is
+    re-raised once all of the calls have completed.
+    """
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        futures = [pool.submit(call) for call in calls]
+    for future in futures:
+        future.result()
+
+
+def _get_pool_scale():
+    """Returns the factor, read from the SAWTOOTH_POOL_SCALE environment
+    variable, by which the per-CPU thread pool sizes are multiplied.
+    """
+    scale = os.environ.get('SAWTOOTH_POOL_SCALE')
+    if scale is None:
+        return 1.0
+
+    try:
+        value = float(scale)
+    except ValueError:
+        value = 0.0
+
+    if value <= 0:
+        LOGGER.warning(
+            'Ignoring invalid SAWTOOTH_POOL_SCALE %s; expected a positive '
+            'number', scale)
+        return 1.0
+
+    return value
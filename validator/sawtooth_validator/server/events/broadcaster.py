@@ -34,7 +34,15 @@ class NoKnownBlockError(Exception):
 
 
 class EventBroadcaster(ChainObserver):
-    def __init__(self, service, block_store, receipt_store):
+    def __init__(self, service, block_store, receipt_store, lazy=False):
+        """
+        Args:
+            lazy (bool): serialize each event once per broadcast and send
+                every subscriber the concatenation of the frames it is
+                subscribed to, rather than building and serializing an
+                EventList per subscriber.
+        """
+        self._lazy = lazy
         self._subscribers = {}
         self._subscribers_cv = Condition()
         self._service = service
@@ -251,13 +259,29 @@ class EventBroadcaster(ChainObserver):
                 conn: sub.copy() for conn, sub in self._subscribers.items()
             }
 
-        if subscribers:
+        if not subscribers:
+            return
+
+        if self._lazy:
+            # A serialized EventList is the concatenation of its serialized
+            # events, so each event's frame can be shared by every subscriber.
+            # The frames are immutable bytes, so no subscriber can alter what
+            # another one is sent.
+            frames = [(event, EventList(events=[event]).SerializeToString())
+                      for event in events]
             for connection_id, subscriber in subscribers.items():
                 if subscriber.is_listening():
-                    subscriber_events = [event for event in events
-                                         if subscriber.is_subscribed(event)]
-                    event_list = EventList(events=subscriber_events)
-                    self._send(connection_id, event_list.SerializeToString())
+                    self._send(connection_id, b''.join(
+                        frame for event, frame in frames
+                        if subscriber.is_subscribed(event)))
+            return
+
+        for connection_id, subscriber in subscribers.items():
+            if subscriber.is_listening():
+                subscriber_events = [event for event in events
+                                     if subscriber.is_subscribed(event)]
+                event_list = EventList(events=subscriber_events)
+                self._send(connection_id, event_list.SerializeToString())
 
     def _send(self, connection_id, message_bytes):
         self._service.send(validator_pb2.Message.CLIENT_EVENTS,
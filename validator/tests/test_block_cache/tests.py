@@ -64,3 +64,84 @@ class BlockCacheTest(unittest.TestCase):
         self.assertIn("ABC", cache)
         self.assertNotIn("DEF", cache)
         self.assertIn("FED", cache)
+
+    def test_block_cache_2q(self):
+        """Test that a cache with the 2Q policy keeps a block which has been
+        accessed more than once while a scan of other blocks passes through,
+        and holds no more than max_entries blocks.
+        """
+        blocks = [_create_block("{:03}".format(i), "{:03}".format(i - 1))
+                  for i in range(1, 11)]
+        block_store = {block.header_signature: block for block in blocks}
+        cache = BlockCache(block_store=block_store, keep_time=300,
+                           purge_frequency=300, policy='2Q', max_entries=4)
+
+        cache["001"] = blocks[0]
+        self.assertEqual(blocks[0], cache["001"])
+
+        for block in blocks[1:]:
+            self.assertEqual(block, cache[block.header_signature])
+            self.assertLessEqual(len(cache), 4)
+
+        # Look in the underlying dict, as lookups through the cache reload
+        # evicted blocks from the block store
+        self.assertIn("001", cache.cache)
+        self.assertIn("010", cache.cache)
+        self.assertNotIn("002", cache.cache)
+
+        self.assertEqual(blocks[1], cache["002"])
+
+    def test_block_cache_2q_keeps_uncommitted_blocks(self):
+        """Test that a cache with the 2Q policy does not evict blocks which
+        are not in the block store, even when over max_entries.
+        """
+        cache = BlockCache(block_store={}, keep_time=300,
+                           purge_frequency=300, policy='2Q', max_entries=2)
+
+        for i in range(1, 5):
+            block = _create_block("{:03}".format(i), "{:03}".format(i - 1))
+            cache[block.header_signature] = block
+
+        self.assertEqual(4, len(cache))
+
+    def test_block_cache_2q_skips_known_uncommitted_blocks(self):
+        """Test that a cache with the 2Q policy checks the block store for an
+        uncommitted block once, rather than on every insert, and evicts it
+        after it has been committed.
+        """
+        block_store = _CountingBlockStore()
+        cache = BlockCache(block_store=block_store, keep_time=300,
+                           purge_frequency=300, policy='2Q', max_entries=2)
+
+        blocks = [_create_block("{:03}".format(i), "{:03}".format(i - 1))
+                  for i in range(1, 6)]
+        for block in blocks[:4]:
+            cache[block.header_signature] = block
+
+        block_store.lookups = 0
+        cache[blocks[4].header_signature] = blocks[4]
+        self.assertEqual(1, block_store.lookups)
+        self.assertEqual(5, len(cache))
+
+        block_store.update(
+            {block.header_signature: block for block in blocks})
+        cache._purge_expired()
+        cache[blocks[0].header_signature] = blocks[0]
+
+        self.assertEqual(2, len(cache))
+
+
+class _CountingBlockStore(dict):
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+
+    def __contains__(self, block_id):
+        self.lookups += 1
+        return super().__contains__(block_id)
+
+
+def _create_block(block_id, previous_block_id):
+    header = BlockHeader(previous_block_id=previous_block_id)
+    return BlockWrapper(Block(header=header.SerializeToString(),
+                              header_signature=block_id))
@@ -163,6 +163,7 @@ class TestValidatorConfig(unittest.TestCase):
         self.assertEquals(config.scheduler, "serial")
         self.assertEquals(config.minimum_peer_connectivity, 3)
         self.assertEquals(config.maximum_peer_connectivity, 10)
+        self.assertEquals(config.block_cache_size, 4096)
 
     def test_validator_config_load_from_file(self):
         """Tests loading config settings from a TOML configuration file.
@@ -209,6 +210,8 @@ class TestValidatorConfig(unittest.TestCase):
                 fd.write(os.linesep)
                 fd.write('maximum_peer_connectivity = 100')
                 fd.write(os.linesep)
+                fd.write('block_cache_size = 1024')
+                fd.write(os.linesep)
                 fd.write('[roles]')
                 fd.write(os.linesep)
                 fd.write('network = "trust"')
@@ -229,6 +232,7 @@ class TestValidatorConfig(unittest.TestCase):
             self.assertEquals(config.opentsdb_password, "secret")
             self.assertEquals(config.minimum_peer_connectivity, 1)
             self.assertEquals(config.maximum_peer_connectivity, 100)
+            self.assertEquals(config.block_cache_size, 1024)
 
 
         finally:
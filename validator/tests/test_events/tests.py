@@ -368,6 +368,37 @@ class EventBroadcasterTest(unittest.TestCase):
             validator_pb2.Message.CLIENT_EVENTS,
             event_list, connection_id="test_conn_id")
 
+    def test_broadcast_events_lazy(self):
+        """Test that a lazy broadcaster sends each subscriber the same bytes
+        as an EventList of the events it is subscribed to.
+        """
+        mock_service = Mock()
+        event_broadcaster = EventBroadcaster(
+            mock_service, Mock(), Mock(), lazy=True)
+
+        event_broadcaster.add_subscriber(
+            "commit_conn_id", [create_block_commit_subscription()], [])
+        event_broadcaster.add_subscriber(
+            "other_conn_id",
+            [EventSubscription(event_type="other/event")], [])
+        event_broadcaster.enable_subscriber("commit_conn_id")
+        event_broadcaster.enable_subscriber("other_conn_id")
+
+        commit_event = events_pb2.Event(event_type="sawtooth/block-commit")
+        other_event = events_pb2.Event(event_type="other/event")
+        event_broadcaster.broadcast_events([commit_event, other_event])
+
+        sent = {
+            kwargs["connection_id"]: args[1]
+            for args, kwargs in mock_service.send.call_args_list
+        }
+        self.assertEqual(
+            events_pb2.EventList(events=[commit_event]).SerializeToString(),
+            sent["commit_conn_id"])
+        self.assertEqual(
+            events_pb2.EventList(events=[other_event]).SerializeToString(),
+            sent["other_conn_id"])
+
 
 class TpEventAddHandlerTest(unittest.TestCase):
     def test_add_event(self):
@@ -0,0 +1,134 @@
+# Copyright 2017 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+from sawtooth_validator.database.indexed_database import IndexedDatabase
+from sawtooth_validator.database.lmdb_environment import LMDBEnvironment
+from sawtooth_validator.database.lmdb_nolock_database import \
+    LMDBNoLockDatabase
+
+
+class LMDBEnvironmentTest(unittest.TestCase):
+    def __init__(self, test_name):
+        super().__init__(test_name)
+        self._temp_dir = None
+        self._env = None
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+        self._env = LMDBEnvironment(
+            os.path.join(self._temp_dir, 'test_env'), 'c')
+
+    def tearDown(self):
+        self._env.close()
+        shutil.rmtree(self._temp_dir)
+
+    def test_dbis_are_independent(self):
+        """Test that two named databases opened from the same environment
+        do not see each other's keys, and that closing one leaves the other
+        usable.
+        """
+        first = self._env.open_dbi('first')
+        second = self._env.open_dbi('second')
+
+        first.put('a', 1)
+        first.put('b', 2)
+        second.put('a', 'other')
+
+        self.assertEqual(2, len(first))
+        self.assertEqual(1, len(second))
+        self.assertEqual(1, first.get('a'))
+        self.assertEqual('other', second.get('a'))
+        self.assertFalse('b' in second)
+
+        first.close()
+
+        self.assertEqual(['a'], second.keys())
+
+    def test_indexed_dbi(self):
+        """Test that an indexed database opened from an environment can be
+        read through its index, and that its databases do not collide with
+        a plain database in the same environment.
+        """
+        plain = self._env.open_dbi('main')
+        indexed = self._env.open_indexed_dbi(
+            'records', _serialize_tuple, _deserialize_tuple,
+            indexes={'name': lambda tup: [tup[1].encode()]})
+
+        plain.put('1', 'plain')
+        indexed.update(
+            [('2', (2, 'bob', "Bob's data")),
+             ('1', (1, 'alice', "Alice's data"))],
+            [])
+
+        self.assertEqual(['1'], plain.keys())
+        self.assertEqual(['1', '2'], indexed.keys())
+        self.assertEqual(
+            (2, 'bob', "Bob's data"), indexed.get('bob', index='name'))
+
+    def test_import_legacy(self):
+        """Test that records in standalone database files are imported into
+        the named databases of an environment, and that records already in
+        the environment are kept.
+        """
+        legacy_plain = LMDBNoLockDatabase(
+            os.path.join(self._temp_dir, 'plain.lmdb'), 'c')
+        legacy_plain.put('1', 'legacy')
+        legacy_plain.put('2', 'legacy')
+        legacy_plain.close()
+
+        indexes = {'name': lambda tup: [tup[1].encode()]}
+        legacy_indexed = IndexedDatabase(
+            os.path.join(self._temp_dir, 'indexed.lmdb'),
+            _serialize_tuple, _deserialize_tuple,
+            indexes=indexes, flag='c')
+        legacy_indexed.put('1', (1, 'alice', "Alice's data"))
+        legacy_indexed.close()
+
+        plain = self._env.open_dbi('plain')
+        plain.put('1', 'current')
+        plain.import_legacy(os.path.join(self._temp_dir, 'plain.lmdb'))
+
+        indexed = self._env.open_indexed_dbi(
+            'records', _serialize_tuple, _deserialize_tuple, indexes=indexes)
+        indexed.import_legacy(os.path.join(self._temp_dir, 'indexed.lmdb'))
+
+        self.assertEqual('current', plain.get('1'))
+        self.assertEqual('legacy', plain.get('2'))
+        self.assertEqual(
+            (1, 'alice', "Alice's data"), indexed.get('alice', index='name'))
+
+    def test_map_size(self):
+        """Test that the environment is opened with the given map size.
+        """
+        env = LMDBEnvironment(
+            os.path.join(self._temp_dir, 'sized_env'), 'c',
+            map_size=64 * 1024**2)
+        try:
+            self.assertEqual(64 * 1024**2, env._lmdb.info()['map_size'])
+        finally:
+            env.close()
+
+
+def _serialize_tuple(tup):
+    return "{}-{}-{}".format(*tup).encode()
+
+
+def _deserialize_tuple(bytestring):
+    (rec_id, name, data) = tuple(bytestring.decode().split('-'))
+    return (int(rec_id), name, data)
@@ -619,3 +619,30 @@ class TestIdentityCache(unittest.TestCase):
         self.assertEquals(
             self._identity_cache.get_role("network", "state_root"),
             identity_view.get_role("network"))
+
+    def test_thread_local_cache_invalidate(self):
+        """
+        Test that values held in the per-thread cache are dropped when the
+        item is invalidated, and that the per-thread cache stays within its
+        size.
+        """
+        identity_cache = IdentityCache(
+            self._identity_view_factory,
+            self._current_root_func,
+            thread_local_cache_size=1)
+        self._identity_view_factory.add_policy("policy1", ["PERMIT_KEY key"])
+        self._identity_view_factory.add_policy("policy2", ["DENY_KEY key"])
+        self._identity_view_factory.add_role("network", "policy1")
+
+        self.assertEqual(
+            identity_cache.get_role("network", "state_root").policy_name,
+            "policy1")
+        identity_cache.get_policy("policy1", "state_root")
+        self.assertEqual(len(identity_cache._local_cache()), 1)
+
+        self._identity_view_factory.add_role("network", "policy2")
+        identity_cache.invalidate("network")
+
+        self.assertEqual(
+            identity_cache.get_role("network", "state_root").policy_name,
+            "policy2")
@@ -91,6 +91,24 @@ class ReceiptStoreTest(unittest.TestCase):
         with self.assertRaises(KeyError):
             receipt_store.get('unknown')
 
+    def test_chain_update_writes_receipts_once(self):
+        """Tests that chain_update stores all of a block's receipts with a
+        single update of the backing database.
+        """
+        receipt_db = DictDatabase()
+        receipt_db.update = Mock(wraps=receipt_db.update)
+        receipt_store = TransactionReceiptStore(receipt_db)
+
+        receipts = [
+            TransactionReceipt(transaction_id=str(i), data=[str(i).encode()])
+            for i in range(3)]
+        receipt_store.chain_update(None, receipts)
+
+        self.assertEqual(1, receipt_db.update.call_count)
+        for receipt in receipts:
+            self.assertEqual(
+                receipt, receipt_store.get(receipt.transaction_id))
+
 class TransactionReceiptGetRequestHandlerTest(unittest.TestCase):
     def test_get_receipts(self):
         """Tests that the TransactionReceiptGetRequestHandler will return a
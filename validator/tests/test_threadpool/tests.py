@@ -0,0 +1,161 @@
+# Copyright 2017 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+import threading
+import unittest
+
+from sawtooth_validator.concurrent.threadpool import \
+    InstrumentedThreadPoolExecutor
+from sawtooth_validator.concurrent.threadpool import \
+    WorkStealingThreadPoolExecutor
+
+
+class WorkStealingThreadPoolExecutorTest(unittest.TestCase):
+    def test_results_and_exceptions(self):
+        """Test that the futures returned by submit resolve to the result of
+        the task, or to the exception it raised.
+        """
+        executor = WorkStealingThreadPoolExecutor(max_workers=4)
+
+        futures = [executor.submit(pow, i, 2) for i in range(100)]
+        failed = executor.submit(int, 'not a number')
+
+        self.assertEqual([i * i for i in range(100)],
+                         [f.result(timeout=5) for f in futures])
+        with self.assertRaises(ValueError):
+            failed.result(timeout=5)
+
+        executor.shutdown(wait=True)
+
+    def test_tasks_behind_blocked_worker_are_stolen(self):
+        """Test that tasks queued on a worker which is blocked are run by
+        its siblings.
+        """
+        executor = WorkStealingThreadPoolExecutor(max_workers=2)
+        release = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        blocked = executor.submit(block)
+        self.assertTrue(started.wait(timeout=5))
+
+        futures = [executor.submit(threading.current_thread)
+                   for _ in range(10)]
+        threads = {f.result(timeout=5) for f in futures}
+
+        self.assertFalse(blocked.done())
+        self.assertEqual(1, len(threads))
+
+        release.set()
+        blocked.result(timeout=5)
+        executor.shutdown(wait=True)
+
+    def test_steal_oldest_task(self):
+        """Test that a worker with an empty deque steals the oldest task
+        queued on a sibling.
+        """
+        executor = WorkStealingThreadPoolExecutor(max_workers=2)
+        executor._deques[1].extend(['first', 'second'])
+
+        self.assertEqual('first', executor._take(0))
+        self.assertEqual('second', executor._take(0))
+        self.assertIsNone(executor._take(0))
+
+        executor.shutdown(wait=True)
+
+    def test_submit_while_idle_worker_scans(self):
+        """Test that a task submitted while an idle worker is scanning the
+        deques, and a sibling is blocked, runs without waiting for the
+        blocked sibling.
+        """
+        executor = _PausingExecutor(max_workers=2)
+        release = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        blocked = executor.submit(block)
+        self.assertTrue(started.wait(timeout=5))
+        # Runs on the idle worker, leaving the next tie-break on the
+        # blocked one
+        executor.submit(int).result(timeout=5)
+
+        # Hold the idle worker between finding no task and going to sleep
+        executor.pause_worker = 1
+        executor.wakeup(1)
+        self.assertTrue(executor.scanned.wait(timeout=5))
+
+        future = executor.submit(int, '7')
+        executor.resume.set()
+
+        try:
+            self.assertEqual(7, future.result(timeout=2))
+            self.assertFalse(blocked.done())
+        finally:
+            release.set()
+            blocked.result(timeout=5)
+            executor.shutdown(wait=True)
+
+    def test_shutdown(self):
+        """Test that shutdown runs tasks which were already submitted, stops
+        the workers, and that tasks cannot be submitted afterwards.
+        """
+        executor = WorkStealingThreadPoolExecutor(max_workers=3)
+        futures = [executor.submit(abs, -i) for i in range(20)]
+
+        executor.shutdown(wait=True)
+
+        self.assertTrue(all(f.done() for f in futures))
+        with self.assertRaises(RuntimeError):
+            executor.submit(abs, -1)
+
+    def test_instrumented_work_stealing(self):
+        """Test that an InstrumentedThreadPoolExecutor created with
+        work_stealing runs its tasks.
+        """
+        executor = InstrumentedThreadPoolExecutor(
+            max_workers=2, name='Test', work_stealing=True)
+
+        future = executor.submit(sum, [1, 2, 3])
+
+        self.assertEqual(6, future.result(timeout=5))
+        executor.shutdown(wait=True)
+
+
+class _PausingExecutor(WorkStealingThreadPoolExecutor):
+    """Pauses one worker after a scan of the deques finds no task, until
+    resume is set.
+    """
+
+    def __init__(self, max_workers):
+        super().__init__(max_workers=max_workers)
+        self.pause_worker = None
+        self.scanned = threading.Event()
+        self.resume = threading.Event()
+
+    def wakeup(self, index):
+        self._wakeups[index].set()
+
+    def _next_task(self, index):
+        work = super()._next_task(index)
+        if work is None and index == self.pause_worker:
+            self.pause_worker = None
+            self.scanned.set()
+            self.resume.wait()
+        return work